@@ -2,13 +2,21 @@
 Application Entry Point
 -----------------------
 This script serves as the 'Entry Point' for the application.
+
+Running it directly starts Flask's single-threaded development server.
+In production, serve the app factory with a preforking WSGI server instead:
+
+    gunicorn -w $(nproc) -k gthread --threads 4 --preload -b 0.0.0.0:5000 "src:create_app()"
+
+--preload loads the dataset once in the master process, so the workers
+share it via copy-on-write instead of each holding its own copy.
 """
 from src import create_app
 
 app = create_app()
 
 if __name__ == "__main__":
-    # Run the built-in Flask development server.
+    # Run the built-in Flask development server (local development only).
     # debug=True enables:
         # 1. Auto-reloading: Server restarts when code changes.
         # 2. Interactive Debugger: Shows stack traces in the browser on crash.
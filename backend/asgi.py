@@ -0,0 +1,16 @@
+"""
+ASGI Entry Point
+----------------
+Exposes the Flask application as an ASGI app so it can be served by an
+async server such as uvicorn:
+
+    uvicorn asgi:asgi_app --workers 4
+
+WsgiToAsgi runs the (synchronous) Flask handlers in a thread pool, so the
+routes stay unchanged while the server handles connections asynchronously.
+"""
+from asgiref.wsgi import WsgiToAsgi
+
+from src import create_app
+
+asgi_app = WsgiToAsgi(create_app())
@@ -6,13 +6,32 @@ It implements the 'Application Factory' pattern, which allows for
 creating multiple instances of the app with different configurations
 """
 
+import orjson
 from flask import Flask
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
 # Import the blueprint that encapsulates all song-related routes
 from .routes import songs_bp, main_bp
 
 
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson instead of the stdlib json module.
+
+    Flask routes every jsonify() call through app.json, so swapping the
+    provider makes all endpoints serialize with orjson (written in Rust)
+    without touching the route handlers.
+    """
+
+    def dumps(self, obj, **kwargs):
+        # Match Flask's default provider (sort_keys=True) so object keys keep alphabetical order
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def create_app() -> Flask:
     """
     Construct the core Flask application.
@@ -24,6 +43,8 @@ def create_app() -> Flask:
         Flask: A fully configured Flask application instance ready to run.
     """
     app = Flask(__name__)
+    # Serialize every JSON response with orjson (must be set before blueprints run)
+    app.json = OrjsonProvider(app)
     # Enable Cross-Origin Resource Sharing (CORS)
     CORS(app)
 
@@ -7,52 +7,78 @@ and this module normalizes it into a standard row-oriented list of dictionaries,
 which is easier for the frontend and API to consume.
 """
 
-import json
+import mmap
 import os
 
+import orjson
+
 
 def load_raw_json(path):
     """
-    Load a JSON file from the specified path.
+    Load a column-oriented JSON file and convert each column into a list.
+
+    The raw JSON maps every attribute to an {index: value} object with string
+    keys ("0", "1", ...). Converting those objects into plain lists once at load
+    time lets the rest of the pipeline index columns by position instead of
+    hashing string keys for every cell.
 
     Args:
         path (str): The absolute or relative file path to the JSON file.
 
     Returns:
-        dict: The parsed JSON data as a Python dictionary.
+        dict: A mapping of {attribute: [value_row_0, value_row_1, ...]}.
     """
-    with open(path, "r", encoding="utf8") as f:
-        return json.load(f)
+    # Map the file instead of reading it: orjson parses straight from the mapped pages,
+    # so there is no intermediate bytes copy of the whole file (and no text decode step)
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The memoryview must be released before the mapping can be closed
+            with memoryview(mm) as view:
+                raw = orjson.loads(view)
 
-def normalize(data):
+    return columns_to_lists(raw)
+
+def columns_to_lists(data):
     """
-    Pivot the dataset from a Column-Oriented format to a Row-Oriented format.
+    Convert {attribute: {index: value}} columns into {attribute: [values]}.
+
+    The row count is taken from the first attribute; cells missing from any
+    other column become None.
 
     Args:
         data (dict): The raw dictionary where keys are attributes (columns)
                      and values are maps of index-to-value.
 
+    Returns:
+        dict: A mapping of {attribute: list_of_values} ordered by row index.
+    """
+    if not data:
+        return {}
+
+    row_count = len(next(iter(data.values())))
+    # The raw JSON uses string keys ("0", "1") instead of integers; convert each index once, not once per cell
+    index_keys = list(map(str, range(row_count)))
+
+    # Use .get() to handle potential missing keys gracefully, returning None if missing
+    return {attr: list(map(column.get, index_keys)) for attr, column in data.items()}
+
+def normalize(data):
+    """
+    Pivot the dataset from a Column-Oriented format to a Row-Oriented format.
+
+    Args:
+        data (dict): A mapping of attributes (columns) to equal-length lists
+                     of values, as returned by load_raw_json().
+
     Returns:
         list[dict]: A list of dictionaries, where each dictionary represents
                     a single row (song) with all its attributes.
-    """     
+    """
     attributes = list(data.keys())
-    first_attr = attributes[0]
-    row_count = len(data[first_attr])
-    
-    normalized_rows = [] 
-    
-    for i in range(row_count): 
-        row = {}
-        
-        for attr in attributes:
-            
-            index_key = str(i) # The raw JSON uses string keys ("0", "1") instead of integers.
-            row[attr] = data[attr].get(index_key) # Use .get() to handle potential missing keys gracefully, returning None if missing
-            
-        normalized_rows.append(row) #once inner loop is done for each iteration, the one row will have all attributes of a song, add to the list normalized rows
-        
-    return normalized_rows
+
+    # zip(*columns) transposes the parallel column lists into per-row value tuples in C,
+    # and zip(attributes, values) pairs them back up with their names for each row dict
+    return [dict(zip(attributes, values)) for values in zip(*data.values())]
 
 #testing logic
 if __name__ == "__main__":
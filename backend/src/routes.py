@@ -11,9 +11,45 @@ Responsibilities:
 3. Delegate business logic to the service layer.
 4. Return standardized JSON responses and HTTP status codes.
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
+
+from .services import (
+    DATASET_ETAG,
+    song_count,
+    song_rows_json,
+    songs_data_json,
+    songs_data_encoded,
+    title_index,
+    clamp_page,
+    fold_title,
+    get_page_json,
+    get_search_json,
+)
+
+# The dataset is immutable for the lifetime of the process, so clients may cache responses
+CACHE_CONTROL = "public, max-age=3600"
+
+
+def _client_has(etag):
+    """Check whether the request's If-None-Match header already covers this ETag."""
+    return request.if_none_match.contains_weak(etag)
+
+
+def _not_modified(etag):
+    """Build an empty 304 Not Modified response for a cached representation."""
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def _cacheable_json(body, etag):
+    """Wrap pre-serialized JSON bytes in a response carrying ETag and Cache-Control headers."""
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
 
-from .services import songs_data, title_index, paginate_songs
 
 main_bp = Blueprint("main", __name__)
 
@@ -37,9 +73,27 @@ def get_all_songs():
 
     Returns:
         JSON: A list of all song objects.
-        200 OK
+        200 OK: Compressed with br or gzip when the client's Accept-Encoding allows it.
+        304 Not Modified: If the client's If-None-Match matches the dataset ETag.
     """
-    return jsonify(songs_data)
+    # Pick the best pre-compressed body the client accepts (None means send it uncompressed)
+    encoding = request.accept_encodings.best_match(tuple(songs_data_encoded))
+
+    # Each encoding is a different representation, so it needs its own ETag
+    etag = f"{DATASET_ETAG}-{encoding}" if encoding else DATASET_ETAG
+
+    if _client_has(etag):
+        response = _not_modified(etag)
+    elif encoding:
+        response = _cacheable_json(songs_data_encoded[encoding], etag)
+        response.headers["Content-Encoding"] = encoding
+    else:
+        # Body is serialized once at startup; no per-request encoding work
+        response = _cacheable_json(songs_data_json, etag)
+
+    # The body depends on Accept-Encoding, so shared caches must key on it too
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 @songs_bp.route("/songs", methods=["GET"])
@@ -55,14 +109,21 @@ def get_songs_page():
         JSON: A dictionary containing metadata (total items, total pages) 
               and the list of songs for the requested page.
         200 OK
+        304 Not Modified: If the client already holds this page (ETag match).
     """
     
     #type=int automatically casts the string; if it fails, Flask handles the error. Default values ensure the API works even if params are missing
     page = request.args.get("page", default=1, type=int) 
     size = request.args.get("size", default=10, type=int)
 
-    response = paginate_songs(songs_data, page, size)
-    return jsonify(response)
+    # Clamp first so the cache key is the effective (page, size) pair
+    page, size, _ = clamp_page(song_count, page, size)
+
+    etag = f"{DATASET_ETAG}-p{page}-s{size}"
+    if _client_has(etag):
+        return _not_modified(etag)
+
+    return _cacheable_json(get_page_json(page, size), etag)
 
 
 @songs_bp.route("/songs/title", methods=["GET"])
@@ -78,6 +139,7 @@ def get_song_by_title():
         400 Bad Request: If the 'title' parameter is missing or empty.
         404 Not Found: If no song matches the provided title.
         200 OK: If the song is found.
+        304 Not Modified: If the client already holds this song (ETag match).
     """
     
     raw_title = request.args.get("title")
@@ -89,10 +151,39 @@ def get_song_by_title():
     if not user_title:
         return jsonify({"error": "title cannot be empty"}), 400
 
-    key = user_title.casefold()
-    song = title_index.get(key) #constant lookup
+    key = fold_title(user_title) # same normalization the index was built with
+    index = title_index.get(key) #constant lookup
 
-    if song is None:
+    if index is None:
         return jsonify({"error": "Song not found"}), 404
 
-    return jsonify(song)
+    etag = f"{DATASET_ETAG}-t{index}"
+    if _client_has(etag):
+        return _not_modified(etag)
+
+    return _cacheable_json(song_rows_json[index], etag) # song is already serialized
+
+
+@songs_bp.route("/songs/search", methods=["GET"])
+def search_songs_by_prefix():
+    """
+    Search for songs whose title starts with a prefix (Case-Insensitive).
+
+    Query Parameters:
+        prefix (str): The beginning of the title to search for.
+
+    Returns:
+        JSON: A list of matching song objects, ordered by title (may be empty).
+        400 Bad Request: If the 'prefix' parameter is missing or empty.
+        200 OK
+    """
+    raw_prefix = request.args.get("prefix")
+
+    if raw_prefix is None:
+        return jsonify({"error": "prefix query parameter is required"}), 400
+
+    prefix = raw_prefix.strip()
+    if not prefix:
+        return jsonify({"error": "prefix cannot be empty"}), 400
+
+    return Response(get_search_json(prefix), mimetype="application/json")
@@ -8,13 +8,22 @@ web layer (Routes).
 Responsibilities:
 1. Data Ingestion: Loading and normalizing the dataset at startup.
 2. Indexing: Creating efficient lookup structures (Hash Maps) for fast searching.
-3. Logic: Handling calculations like pagination algorithms.
+3. Logic: Handling calculations like pagination algorithms and prefix search.
 
 By separating this logic from 'routes.py', we ensure that the API layer 
 stays thin and focused only on HTTP mechanics.
 """
-import math
+import gzip
+import hashlib
 import os
+from bisect import bisect_left
+
+import orjson
+
+try:
+    import brotli
+except ImportError: # brotli is optional; gzip from the standard library is always available
+    brotli = None
 
 from .normalize import load_raw_json, normalize
 
@@ -24,39 +33,129 @@ _BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 _DATA_PATH = os.path.join(_BASE_DIR, "data", "playlist.json")
 
 
+def fold_title(title):
+    """
+    Normalize a title for Case-Insensitive Search.
+
+    Used both when building title_index and when looking a title up, so the
+    two sides can never drift apart. casefold() is kept over lower(): CPython
+    already takes the same ASCII fast path for both, and casefold() also
+    matches non-ASCII forms (e.g. "ß" and "ss").
+    """
+    return title.casefold()
+
+
 def load_dataset():
     """
     Perform the ETL (Extract, Transform, Load) process for the application.
 
     This function:
-    1. Loads the raw JSON file from disk.
-    2. Normalizes it into a list of dictionaries.
-    3. Builds an in-memory Hash Map (Index) for O(1) title lookups.
+    1. Loads the raw JSON file from disk as column lists.
+    2. Builds an in-memory Hash Map (Index) for O(1) title lookups.
+    3. Normalizes the columns into rows and serializes each row to JSON once.
+
+    Each song is kept only as its serialized JSON object. A compact bytes value
+    per row is much smaller than a dict with its own hash table, and it is exactly
+    what every endpoint sends; the column lists and the row dicts built by
+    normalize() are discarded once this function returns.
 
     Returns:
         tuple: A tuple containing:
-            - normalized_data (list): The full list of song objects.
-            - title_index (dict): A mapping of {casefolded_title: song_object}.
+            - song_rows_json (list[bytes]): Every song serialized as a JSON object.
+            - title_index (dict): A mapping of {casefolded_title: row_index}.
     """
     raw_data = load_raw_json(_DATA_PATH)
-    normalized_data = normalize(raw_data)
 
-    title_index = {}
-    
+    titles = raw_data.get("title", [])
+
     # We pre-compute this index now so user requests are instant.
-    for song in normalized_data:
-        title = song.get("title")
-        if not title:
-            continue
-        key = title.casefold() # Normalization for Case-Insensitive Search
-        # Handling Duplicates: keep first occurrence for a given title
-        title_index.setdefault(key, song)
+    # Handling Duplicates: rows are walked in reverse so the first occurrence
+    # of a title is the last write and wins.
+    title_index = {
+        fold_title(title): index
+        for index in range(len(titles) - 1, -1, -1)
+        if (title := titles[index])
+    }
 
-    return normalized_data, title_index
+    # Keys are sorted like Flask's default JSON provider, so every song object keeps
+    # the alphabetical key order clients (e.g. the CSV export) have always received
+    song_rows_json = [orjson.dumps(row, option=orjson.OPT_SORT_KEYS) for row in normalize(raw_data)]
+
+    return song_rows_json, title_index
+
+
+def _json_array(rows):
+    """Join already-serialized JSON values into a serialized JSON array."""
+    return b"[" + b",".join(rows) + b"]"
 
 
 # Increases startup time slightly, but subsequent API requests are very fast because data is already in RAM
-songs_data, title_index = load_dataset()
+song_rows_json, title_index = load_dataset()
+song_count = len(song_rows_json)
+
+# The dataset never changes after startup, so /songs/all can be serialized exactly once
+songs_data_json = _json_array(song_rows_json)
+
+# Compress /songs/all once at startup rather than per request, keyed by Content-Encoding
+# token in server preference order (brotli compresses JSON better than gzip when available)
+songs_data_encoded = {}
+if brotli is not None:
+    songs_data_encoded["br"] = brotli.compress(songs_data_json)
+# mtime=0 keeps the gzip header (and so the body behind its strong ETag) identical across processes
+songs_data_encoded["gzip"] = gzip.compress(songs_data_json, 6, mtime=0)
+
+# Content hash of the whole dataset. Every cacheable response derives its ETag from this,
+# so all of them change together if the dataset file ever changes between deploys.
+DATASET_ETAG = hashlib.blake2b(songs_data_json, digest_size=8).hexdigest()
+
+# Page sizes the frontend requests; their page slices are serialized once at startup
+PRECOMPUTED_PAGE_SIZES = (10, 20, 50)
+
+# Fixed /songs envelope, keys in the same alphabetical order Flask's default provider used.
+# The header and tail are formatted per request and the already-serialized page slice
+# is concatenated between them.
+_PAGE_HEADER = b'{"page":%d,"size":%d,"songs":'
+_PAGE_TAIL = b',"total":%d,"total_pages":%d}'
+
+
+def _build_page_cache(rows, sizes):
+    """
+    Serialize every page slice of the dataset for each of the given sizes.
+
+    Returns:
+        dict: A mapping of {size: [page_1_bytes, page_2_bytes, ...]}.
+    """
+    return {
+        size: [_json_array(rows[start:start + size]) for start in range(0, len(rows), size)]
+        for size in sizes
+    }
+
+
+_page_cache = _build_page_cache(song_rows_json, PRECOMPUTED_PAGE_SIZES)
+
+
+def clamp_page(total_items, page, size):
+    """
+    Validate and clamp the pagination parameters against the dataset size.
+
+    Args:
+        total_items (int): The number of items being paginated.
+        page (int): The requested page number.
+        size (int): The requested number of items per page.
+
+    Returns:
+        tuple: A tuple of (page, size, total_pages) with page clamped into
+               the valid range 1..total_pages.
+    """
+    size = size if (isinstance(size, int) and size > 0) else 10 # Fall back to the default for missing or invalid sizes
+
+    # Integer ceiling division so the last partial page of data is not dropped (no float round-trip)
+    total_pages = (total_items + size - 1) // size
+
+    # clamp page into valid range 1..total_pages (an empty dataset still has page 1)
+    page = min(max(page or 1, 1), max(total_pages, 1))
+
+    return page, size, total_pages
 
 
 def paginate_songs(items, page, size):
@@ -72,17 +171,8 @@ def paginate_songs(items, page, size):
         dict: A dictionary containing the sliced data and pagination metadata
               (total_pages, current_page, etc.) used by the frontend.
     """
-    if size is None or size <= 0:
-        size = 10
-
     total_items = len(items)
-    total_pages = math.ceil(total_items / size) if size > 0 else 1 # math.ceil ensures we don't drop the last partial page of data
-
-    # clamp page into valid range
-    if page is None or page < 1: # Ensure page is at least 1
-        page = 1
-    if total_pages > 0 and page > total_pages:
-        page = total_pages
+    page, size, total_pages = clamp_page(total_items, page, size)
 
     # Calculate the start and end indices for the Python list slice
     start = (page - 1) * size
@@ -96,3 +186,78 @@ def paginate_songs(items, page, size):
         "total_pages": total_pages,
         "songs": page_data,
     }
+
+
+def get_page_json(page, size):
+    """
+    Return the serialized /songs response body for a page of the dataset.
+
+    Callers must pass a pair already clamped by clamp_page().
+
+    Common sizes are answered from the startup page cache by wrapping the
+    precomputed slice in the envelope. A size covering the whole dataset
+    wraps the precomputed /songs/all body. Any other size joins its slice of
+    the pre-serialized rows per request; nothing is cached for those sizes,
+    so clients cannot grow memory by varying the size parameter.
+
+    Returns:
+        bytes: The JSON-encoded pagination object.
+    """
+    pages = _page_cache.get(size)
+    if pages is not None and page <= len(pages):
+        # A single join copies the cached slice once, unlike chained + concatenation
+        return b"".join((_PAGE_HEADER % (page, size), pages[page - 1], _PAGE_TAIL % (song_count, len(pages))))
+
+    if size >= song_count:
+        # Any such size is a single page holding the whole dataset, so reuse the /songs/all bytes
+        total_pages = (song_count + size - 1) // size
+        return b"".join((_PAGE_HEADER % (page, size), songs_data_json, _PAGE_TAIL % (song_count, total_pages)))
+
+    return _serialize_page(page, size)
+
+
+def _serialize_page(page, size):
+    result = paginate_songs(song_rows_json, page, size)
+    header = _PAGE_HEADER % (result["page"], result["size"])
+    tail = _PAGE_TAIL % (result["total"], result["total_pages"])
+    return b"".join((header, _json_array(result["songs"]), tail))
+
+
+# Folded titles in sorted order, so all titles sharing a prefix sit next to each other
+_sorted_titles = sorted(title_index)
+
+
+def find_prefix(prefix):
+    """
+    Find every song whose title starts with the given prefix (Case-Insensitive).
+
+    A binary search locates the first candidate in the sorted title list, then
+    the scan stops at the first title that no longer matches: O(log n + k)
+    instead of rescanning the whole dataset.
+
+    Args:
+        prefix (str): The title prefix to search for.
+
+    Returns:
+        list[int]: Row indices of the matching songs, ordered by folded title.
+    """
+    key = fold_title(prefix)
+    matches = []
+
+    for position in range(bisect_left(_sorted_titles, key), len(_sorted_titles)):
+        title = _sorted_titles[position]
+        if not title.startswith(key):
+            break
+        matches.append(title_index[title])
+
+    return matches
+
+
+def get_search_json(prefix):
+    """
+    Return the serialized /songs/search response body for a title prefix.
+
+    Returns:
+        bytes: A JSON array of the matching songs (empty if none match).
+    """
+    return _json_array([song_rows_json[index] for index in find_prefix(prefix)])
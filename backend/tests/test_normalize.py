@@ -0,0 +1,52 @@
+"""
+Unit tests for the normalization helpers.
+
+Covers:
+- Converting {index: value} columns into ordered lists
+- Missing cells being filled with None
+- Pivoting column lists into row dictionaries
+- Loading the raw JSON file into column lists
+"""
+from src.normalize import columns_to_lists, load_raw_json, normalize
+
+
+def test_columns_to_lists_orders_by_index():
+    raw = {
+        "title": {"1": "B", "0": "A"},
+        "tempo": {"0": 120.0, "1": 95.5},
+    }
+
+    assert columns_to_lists(raw) == {
+        "title": ["A", "B"],
+        "tempo": [120.0, 95.5],
+    }
+
+
+def test_columns_to_lists_missing_cell_is_none():
+    raw = {
+        "title": {"0": "A", "1": "B"},
+        "tempo": {"0": 120.0},
+    }
+
+    assert columns_to_lists(raw)["tempo"] == [120.0, None]
+
+
+def test_normalize_pivots_columns_into_rows():
+    columns = {
+        "title": ["A", "B"],
+        "tempo": [120.0, 95.5],
+    }
+
+    rows = normalize(columns)
+
+    assert rows == [
+        {"title": "A", "tempo": 120.0},
+        {"title": "B", "tempo": 95.5},
+    ]
+
+
+def test_load_raw_json_returns_column_lists(tmp_path):
+    path = tmp_path / "playlist.json"
+    path.write_text('{"title": {"0": "A", "1": "B"}, "class": {"0": 1, "1": 0}}')
+
+    assert load_raw_json(str(path)) == {"title": ["A", "B"], "class": [1, 0]}
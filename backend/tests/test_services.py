@@ -0,0 +1,90 @@
+"""
+Unit tests for the service layer helpers.
+
+Covers:
+- Pagination parameter defaults and clamping
+- Precomputed page bodies matching the generic pagination output
+- Uncommon page sizes built per request instead of being cached
+- Deterministic gzip body for /songs/all across compressions
+- Pre-serialized rows matching a direct serialization of the dataset
+- Prefix search matching a linear scan of the titles
+- Title index skipping empty titles and keeping the first duplicate
+"""
+import gzip
+
+import orjson
+import pytest
+
+from src import services
+from src.normalize import load_raw_json, normalize
+from src.services import (
+    PRECOMPUTED_PAGE_SIZES,
+    clamp_page,
+    find_prefix,
+    get_page_json,
+    paginate_songs,
+    songs_data_encoded,
+    songs_data_json,
+    title_index,
+)
+
+songs_data = normalize(load_raw_json(services._DATA_PATH))
+
+
+def test_clamp_page_defaults_and_bounds():
+    # Missing or invalid values fall back to page 1, size 10
+    assert clamp_page(100, None, None) == (1, 10, 10)
+    assert clamp_page(100, -4, 0) == (1, 10, 10)
+    # Pages past the end are clamped to the last page
+    assert clamp_page(95, 42, 10) == (10, 10, 10)
+    # An empty dataset still reports page 1
+    assert clamp_page(0, 3, 10) == (1, 10, 0)
+
+
+@pytest.mark.parametrize("size", PRECOMPUTED_PAGE_SIZES + (7,))
+def test_get_page_json_matches_paginate_songs(size):
+    for page in (1, 2, -(-len(songs_data) // size)):
+        expected = paginate_songs(songs_data, page, size)
+        assert orjson.loads(get_page_json(page, size)) == expected
+
+
+def test_get_page_json_uncommon_sizes_are_not_cached():
+    # Sizes just below and at/above the dataset size are not precomputed
+    for size in range(len(songs_data) - 5, len(songs_data) + 5):
+        for page in (1, 2):
+            expected = paginate_songs(songs_data, page, size)
+            assert orjson.loads(get_page_json(expected["page"], size)) == expected
+
+    # Each call builds a fresh body rather than returning a cached object
+    size = len(songs_data) - 1
+    assert get_page_json(1, size) is not get_page_json(1, size)
+
+
+def test_gzip_body_is_identical_across_compressions():
+    # The gzip header carries no timestamp, so every process serves the same
+    # bytes behind the same strong ETag
+    body = songs_data_encoded["gzip"]
+    assert body[4:8] == b"\x00\x00\x00\x00"
+    assert gzip.decompress(body) == songs_data_json
+
+
+def test_songs_data_json_matches_direct_serialization():
+    assert songs_data_json == orjson.dumps(songs_data, option=orjson.OPT_SORT_KEYS)
+
+
+def test_title_index_keeps_first_duplicate(monkeypatch):
+    columns = {"title": ["Echo", None, "ECHO", "", "Other"]}
+    monkeypatch.setattr(services, "load_raw_json", lambda path: columns)
+
+    _, title_index = services.load_dataset()
+
+    assert title_index == {"echo": 0, "other": 4}
+
+
+@pytest.mark.parametrize("prefix", ["a", "The", "21", "zzz"])
+def test_find_prefix_matches_linear_scan(prefix):
+    expected = sorted(
+        (title, index) for title, index in title_index.items() if title.startswith(prefix.casefold())
+    )
+
+    assert find_prefix(prefix) == [index for _, index in expected]
@@ -4,13 +4,23 @@ Integration tests for the songs API endpoints.
 Covers:
 - GET /songs pagination with default and custom page/size
 - Page clamping behavior for values below 1 and above the last page
+- Clamped pages sharing the same cached response body
 - GET /songs/all returning the full dataset as a plain list
+- Song objects and the /songs envelope keeping their keys in alphabetical order
+- GET /songs/all serving a pre-compressed (gzip / br) body based on Accept-Encoding
 - GET /songs/title successful lookup (case insensitive)
 - GET /songs/title error handling for:
   - missing title parameter
   - empty title after trimming whitespace
   - non existing title
+- GET /songs/search prefix matching, empty results and parameter validation
+- ETag / If-None-Match conditional requests returning 304 Not Modified
 """
+import gzip
+
+import pytest
+
+
 def test_get_songs_page_default(client):
     # When no query params are passed, should return page 1, size 10
     resp = client.get("/songs")
@@ -60,6 +70,15 @@ def test_get_songs_page_huge_page_is_clamped_to_last(client):
     assert len(data["songs"]) == 10
 
 
+def test_get_songs_page_clamped_requests_share_body(client):
+    # page 999 is clamped to the last page, so both hit the same cache entry
+    resp_last = client.get("/songs?page=10&size=10")
+    resp_huge = client.get("/songs?page=999&size=10")
+    assert resp_huge.status_code == 200
+    assert resp_huge.mimetype == "application/json"
+    assert resp_huge.data == resp_last.data
+
+
 def test_get_all_songs_returns_full_list(client):
     resp = client.get("/songs/all")
     assert resp.status_code == 200
@@ -73,6 +92,49 @@ def test_get_all_songs_returns_full_list(client):
     assert "title" in data[0]
 
 
+def test_song_keys_are_sorted(client):
+    # Clients such as the CSV export build their columns from the first song's key order
+    for url in ("/songs/all", "/songs?page=1&size=7", "/songs/search?prefix=3a"):
+        resp = client.get(url)
+        data = resp.get_json()
+        if isinstance(data, dict):
+            # The /songs envelope keeps the same order as well
+            assert list(data) == sorted(data)
+            songs = data["songs"]
+        else:
+            songs = data
+        keys = list(songs[0])
+        assert keys == sorted(keys)
+
+    song = client.get("/songs/title?title=3AM").get_json()
+    assert list(song) == sorted(song)
+
+
+def test_get_all_songs_gzip_when_accepted(client):
+    plain = client.get("/songs/all")
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["Vary"]
+
+    resp = client.get("/songs/all", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["Vary"]
+    assert resp.headers["ETag"] != plain.headers["ETag"]
+    assert gzip.decompress(resp.data) == plain.data
+
+
+def test_get_all_songs_brotli_preferred_when_accepted(client):
+    brotli = pytest.importorskip("brotli")
+
+    plain = client.get("/songs/all")
+    resp = client.get("/songs/all", headers={"Accept-Encoding": "gzip, deflate, br"})
+    assert resp.status_code == 200
+    assert resp.headers["Content-Encoding"] == "br"
+    assert "Accept-Encoding" in resp.headers["Vary"]
+    assert resp.headers["ETag"] != plain.headers["ETag"]
+    assert brotli.decompress(resp.data) == plain.data
+
+
 def test_get_song_by_title_success(client):
     # The playlist.json has a song titled "3AM" at index 0
     resp = client.get("/songs/title?title=3AM")
@@ -113,3 +175,61 @@ def test_get_song_by_title_not_found(client):
     data = resp.get_json()
     assert "error" in data
     assert "Song not found" in data["error"]
+
+
+def test_get_all_songs_not_modified_with_matching_etag(client):
+    resp = client.get("/songs/all")
+    etag = resp.headers["ETag"]
+    assert "max-age" in resp.headers["Cache-Control"]
+
+    resp2 = client.get("/songs/all", headers={"If-None-Match": etag})
+    assert resp2.status_code == 304
+    assert resp2.data == b""
+    assert resp2.headers["ETag"] == etag
+
+
+def test_get_songs_page_etag_depends_on_page_and_size(client):
+    etag_p1 = client.get("/songs?page=1&size=10").headers["ETag"]
+    etag_p2 = client.get("/songs?page=2&size=10").headers["ETag"]
+    etag_s5 = client.get("/songs?page=1&size=5").headers["ETag"]
+    assert len({etag_p1, etag_p2, etag_s5}) == 3
+
+    # A stale ETag from another page must not produce a 304
+    resp = client.get("/songs?page=2&size=10", headers={"If-None-Match": etag_p1})
+    assert resp.status_code == 200
+
+    resp = client.get("/songs?page=1&size=10", headers={"If-None-Match": etag_p1})
+    assert resp.status_code == 304
+
+
+def test_get_song_by_title_not_modified_with_matching_etag(client):
+    etag = client.get("/songs/title?title=3AM").headers["ETag"]
+
+    resp = client.get("/songs/title?title=3am", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+def test_search_songs_by_prefix(client):
+    resp = client.get("/songs/search?prefix=3a")
+    assert resp.status_code == 200
+
+    songs = resp.get_json()
+    titles = [song["title"] for song in songs]
+    assert "3AM" in titles
+    assert all(title.casefold().startswith("3a") for title in titles)
+
+
+def test_search_songs_by_prefix_no_match(client):
+    resp = client.get("/songs/search?prefix=THIS_DOES_NOT_EXIST")
+    assert resp.status_code == 200
+    assert resp.get_json() == []
+
+
+def test_search_songs_by_prefix_missing_or_empty(client):
+    resp = client.get("/songs/search")
+    assert resp.status_code == 400
+    assert "prefix query parameter is required" in resp.get_json()["error"]
+
+    resp = client.get("/songs/search?prefix=   ")
+    assert resp.status_code == 400
+    assert "prefix cannot be empty" in resp.get_json()["error"]